@@ -1,28 +1,164 @@
 import pdfplumber
 import pandas as pd
+import argparse
+import json
 import re
-from datetime import datetime
+from bisect import bisect_left
+from datetime import datetime, date
 from pathlib import Path
 import sys
+import projection
+from exporters import ExportPipeline
+
+DATE_FORMAT = "%b %d, %Y"
+TIME_FORMAT = "%I:%M:%S %p"
+
+
+def parse_date(value):
+    """Parse a report date such as 'Jul 14, 2025', returning None if it is malformed"""
+    try:
+        return datetime.strptime(value.strip(), DATE_FORMAT).date()
+    except (AttributeError, ValueError):
+        return None
+
+
+def parse_time(value):
+    """Parse a report time such as '2:00:01 PM' into seconds since midnight, or None"""
+    try:
+        parsed = datetime.strptime(value.strip(), TIME_FORMAT)
+    except (AttributeError, ValueError):
+        return None
+    return parsed.hour * 3600 + parsed.minute * 60 + parsed.second
+
+
+def parse_table_rows(tables):
+    """Turn extracted attendance tables into lecture records, skipping header and malformed rows"""
+    records = []
+    for table in tables:
+        if not table or len(table) < 2:
+            continue
+        
+        # Skip header row
+        for row in table[1:]:
+            if len(row) >= 6 and row[0] and row[0].strip().isdigit():
+                try:
+                    records.append({
+                        'sr_no': int(row[0].strip()),
+                        'course': row[1].strip() if row[1] else '',
+                        'date': row[2].strip() if row[2] else '',
+                        'start_time': row[3].strip() if row[3] else '',
+                        'end_time': row[4].strip() if row[4] else '',
+                        'attendance': row[5].strip() if row[5] else ''
+                    })
+                except (ValueError, IndexError):
+                    continue
+    return records
+
+
+def longest_increasing_positions(values):
+    """Positions of one longest strictly increasing subsequence of values, in O(n log n)"""
+    tails = []          # smallest tail value of an increasing run of each length
+    tail_positions = []
+    parents = [-1] * len(values)
+    for i, value in enumerate(values):
+        length = bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_positions.append(i)
+        else:
+            tails[length] = value
+            tail_positions[length] = i
+        parents[i] = tail_positions[length - 1] if length else -1
+    
+    positions = set()
+    i = tail_positions[-1] if tail_positions else -1
+    while i != -1:
+        positions.add(i)
+        i = parents[i]
+    return positions
+
+
+def build_date_index(day_counts):
+    """Turn a {day ordinal: [present, absent]} mapping into a dense per-day index.
+
+    The index stores the first day ordinal plus two byte arrays with one slot per
+    calendar day, so rollups and streaks are a single pass over the days.
+    """
+    first_day = min(day_counts)
+    num_days = max(day_counts) - first_day + 1
+    present = bytearray(num_days)
+    absent = bytearray(num_days)
+    for ordinal, (p, a) in day_counts.items():
+        present[ordinal - first_day] = min(p, 255)
+        absent[ordinal - first_day] = min(a, 255)
+    return {'first_day': first_day, 'present': present, 'absent': absent}
+
+
+def rollup_date_index(index, period='week'):
+    """Sum present/absent counts per week (keyed by Monday) or per month"""
+    rollup = {}
+    first_day = index['first_day']
+    for offset, (p, a) in enumerate(zip(index['present'], index['absent'])):
+        if not p and not a:
+            continue
+        ordinal = first_day + offset
+        if period == 'week':
+            # Ordinal 1 (Jan 1, year 1) is a Monday
+            key = date.fromordinal(ordinal - (ordinal - 1) % 7)
+        else:
+            day = date.fromordinal(ordinal)
+            key = date(day.year, day.month, 1)
+        counts = rollup.setdefault(key, [0, 0])
+        counts[0] += p
+        counts[1] += a
+    return rollup
+
+
+def date_index_streaks(index):
+    """Longest and current runs of lecture days attended in full, and the longest absent run"""
+    longest = current = longest_absent = absent_run = 0
+    for p, a in zip(index['present'], index['absent']):
+        if not p and not a:
+            # No lectures that day, streaks carry over
+            continue
+        if a:
+            current = 0
+            absent_run += 1
+            longest_absent = max(longest_absent, absent_run)
+        else:
+            current += 1
+            absent_run = 0
+            longest = max(longest, current)
+    return {'longest': longest, 'current': current, 'longest_absent': longest_absent}
+
 
 class AttendanceCalculator:
     def __init__(self, pdf_path):
         self.pdf_path = pdf_path
         self.attendance_data = []
         self.subjects = {}
+        self.date_index = {}
+        self.projection = {}
+        self.validation = {}
         self.student_name = ""
         self.sap_id = ""
         self.program = ""
         self.batch = ""
         self.report_date = datetime.now().strftime("%B %d, %Y")
         
-    def extract_data(self):
-        """Extract attendance data from PDF"""
+    def extract_data(self, workers=1):
+        """Extract attendance data from PDF, spreading pages over worker processes when workers > 1"""
         print(f"Processing: {Path(self.pdf_path).name}")
         print("=" * 80)
         
+        shared = None
         try:
-            with pdfplumber.open(self.pdf_path) as pdf:
+            if workers > 1:
+                # Imported here since shared_pdf reuses parse_table_rows from this module
+                from shared_pdf import SharedPDF
+                shared = SharedPDF(self.pdf_path)
+            
+            with shared.open() if shared else pdfplumber.open(self.pdf_path) as pdf:
                 # Extract student info from first page
                 if len(pdf.pages) > 0:
                     first_page_text = pdf.pages[0].extract_text()
@@ -43,27 +179,11 @@ class AttendanceCalculator:
                             if ':' in line:
                                 self.batch = line.split(':', 1)[1].strip()
                 
-                for page_num, page in enumerate(pdf.pages, 1):
-                    tables = page.extract_tables()
-                    
-                    for table in tables:
-                        if not table or len(table) < 2:
-                            continue
-                        
-                        # Skip header row
-                        for row in table[1:]:
-                            if len(row) >= 6 and row[0] and row[0].strip().isdigit():
-                                try:
-                                    self.attendance_data.append({
-                                        'sr_no': int(row[0].strip()),
-                                        'course': row[1].strip() if row[1] else '',
-                                        'date': row[2].strip() if row[2] else '',
-                                        'start_time': row[3].strip() if row[3] else '',
-                                        'end_time': row[4].strip() if row[4] else '',
-                                        'attendance': row[5].strip() if row[5] else ''
-                                    })
-                                except (ValueError, IndexError) as e:
-                                    continue
+                if shared:
+                    self.attendance_data.extend(shared.extract_records(len(pdf.pages), workers))
+                else:
+                    for page in pdf.pages:
+                        self.attendance_data.extend(parse_table_rows(page.extract_tables()))
                 
                 print(f"Extracted {len(self.attendance_data)} lecture records")
                 if self.student_name:
@@ -75,6 +195,9 @@ class AttendanceCalculator:
         except Exception as e:
             print(f"Error processing PDF: {e}")
             return False
+        finally:
+            if shared:
+                shared.close()
     
     def clean_course_name(self, course_name):
         """Extract base course name by removing course type and section info"""
@@ -102,12 +225,86 @@ class AttendanceCalculator:
         
         return clean_name
     
+    def validate_records(self, deduplicate=False):
+        """Flag duplicate, overlapping and out-of-order lecture records per subject.
+
+        Records are sorted by (date, start_time) and checked in a single sweep. With
+        deduplicate=True exact duplicates are dropped from attendance_data so they
+        are not counted by calculate_subject_attendance().
+        """
+        if not self.attendance_data:
+            print("No data to validate. Please run extract_data() first.")
+            return
+        
+        keyed = []
+        for position, record in enumerate(self.attendance_data):
+            lecture_date = parse_date(record['date'])
+            start = parse_time(record['start_time'])
+            if lecture_date is None or start is None:
+                continue
+            end = parse_time(record['end_time'])
+            keyed.append((lecture_date.toordinal(), start, end if end is not None else start, position))
+        keyed.sort()
+        
+        self.validation = {}
+        
+        def flag(record, kind, detail):
+            subject = self.clean_course_name(record['course'])
+            findings = self.validation.setdefault(subject, {'duplicates': [], 'overlaps': [], 'out_of_order': []})
+            findings[kind].append(detail)
+        
+        duplicate_positions = set()
+        slot = None
+        slot_seen = set()
+        latest = None
+        chronological = []
+        for day, start, end, position in keyed:
+            record = self.attendance_data[position]
+            
+            # Exact duplicates share (date, start_time) so they land in the same slot
+            if slot != (day, start):
+                slot = (day, start)
+                slot_seen = set()
+            identity = (record['course'], record['end_time'], record['attendance'])
+            if identity in slot_seen:
+                duplicate_positions.add(position)
+                flag(record, 'duplicates', record['sr_no'])
+                continue
+            slot_seen.add(identity)
+            
+            # Compare against the lecture that runs latest so far on the same day
+            if latest and latest[0] == day and start < latest[1]:
+                flag(record, 'overlaps', (record['sr_no'], self.attendance_data[latest[2]]['sr_no']))
+            if not latest or latest[0] != day or end > latest[1]:
+                latest = (day, end, position)
+            
+            chronological.append(record)
+        
+        # Serial numbers should follow chronological order; blame only the records
+        # outside the longest run that does, not the ones that follow a stray entry
+        in_order = longest_increasing_positions([record['sr_no'] for record in chronological])
+        for i, record in enumerate(chronological):
+            if i not in in_order:
+                flag(record, 'out_of_order', record['sr_no'])
+        
+        for subject, findings in sorted(self.validation.items()):
+            print(f"Check {subject}: {len(findings['duplicates'])} duplicate(s), "
+                  f"{len(findings['overlaps'])} overlap(s), {len(findings['out_of_order'])} out-of-order")
+        
+        if deduplicate and duplicate_positions:
+            self.attendance_data = [record for position, record in enumerate(self.attendance_data)
+                                    if position not in duplicate_positions]
+            print(f"Removed {len(duplicate_positions)} duplicate record(s)")
+        return self.validation
+    
     def calculate_subject_attendance(self):
         """Calculate attendance percentage for each subject"""
         if not self.attendance_data:
             print("No data to calculate. Please run extract_data() first.")
             return
         
+        day_counts = {}
+        
         # Group by subject
         for record in self.attendance_data:
             subject = self.clean_course_name(record['course'])
@@ -129,13 +326,147 @@ class AttendanceCalculator:
             elif record['attendance'] == 'A':
                 self.subjects[subject]['absent'] += 1
                 self.subjects[subject]['absent_dates'].append(record['date'])
+            
+            # Track per-day counts for the calendar index
+            lecture_date = parse_date(record['date'])
+            if lecture_date and record['attendance'] in ('P', 'A'):
+                counts = day_counts.setdefault(subject, {}).setdefault(lecture_date.toordinal(), [0, 0])
+                counts[0 if record['attendance'] == 'P' else 1] += 1
+        
+        self.date_index = {subject: build_date_index(days) for subject, days in day_counts.items()}
+        
+        # Date the report by its latest lecture, not the run, so unchanged input renders identically
+        if self.date_index:
+            last_day = max(index['first_day'] + len(index['present']) - 1 for index in self.date_index.values())
+            self.report_date = date.fromordinal(last_day).strftime("%B %d, %Y")
     
-    def generate_html_report(self, output_file='attendance_report.html'):
-        """Generate a minimal black and white HTML attendance report"""
+    def get_calendar_summary(self, subject):
+        """Weekly/monthly rollups and streaks for a subject, computed from the date index"""
+        index = self.date_index.get(subject)
+        if not index:
+            return None
+        
+        weekly = rollup_date_index(index, 'week')
+        monthly = rollup_date_index(index, 'month')
+        worst_week = max(weekly.items(), key=lambda item: (item[1][1], item[0]))
+        return {
+            'weekly': weekly,
+            'monthly': monthly,
+            'streaks': date_index_streaks(index),
+            'worst_week': worst_week if worst_week[1][1] > 0 else None
+        }
+    
+    def project_attendance(self, timetable=None, semester_end=None, max_skip=10, trials=1000, seed=None):
+        """Project end-of-semester attendance for every subject under what-if scenarios.
+
+        Remaining lectures come from the timetable mapping when a subject is listed
+        there, otherwise they are extrapolated from past lecture frequency up to
+        semester_end. All subjects are simulated together as one array.
+        """
         if not self.subjects:
-            print("No data available to generate report.")
+            print("No data to project. Please run calculate_subject_attendance() first.")
             return
         
+        timetable = timetable or {}
+        if not timetable and not semester_end:
+            print("No timetable or semester end date given, skipping projection.")
+            return
+        
+        names = sorted(self.subjects)
+        remaining = []
+        for subject in names:
+            if subject in timetable:
+                remaining.append(timetable[subject])
+            elif semester_end:
+                remaining.append(projection.extrapolate_remaining(self.date_index.get(subject), semester_end))
+            else:
+                remaining.append(0)
+        
+        result = projection.project_attendance(
+            [self.subjects[s]['present'] for s in names],
+            [self.subjects[s]['total'] for s in names],
+            remaining, max_skip=max_skip, trials=trials, seed=seed
+        )
+        
+        self.projection = {}
+        for i, subject in enumerate(names):
+            self.projection[subject] = {
+                'remaining': int(remaining[i]),
+                'attend_all': float(result['attend_all'][i]),
+                'skip_k': [float(v) for v in result['skip_k'][:, i]],
+                'safe_skips': int(result['safe_skips'][i]),
+                'reachable': bool(result['reachable'][i]),
+                'mc_mean': float(result['mc_mean'][i]),
+                'mc_p10': float(result['mc_p10'][i]),
+                'mc_p90': float(result['mc_p90'][i]),
+                'mc_prob_safe': float(result['mc_prob_safe'][i])
+            }
+        return self.projection
+    
+    def render_projection(self, subject):
+        """Render the end-of-semester projection block for a subject card"""
+        data = self.projection.get(subject)
+        if not data or data['remaining'] == 0:
+            return ''
+        
+        if data['reachable']:
+            verdict = f"You can skip up to <strong>{data['safe_skips']}</strong> of them and still finish at {projection.ATTENDANCE_THRESHOLD}%."
+        else:
+            verdict = f"Even attending all of them ends below {projection.ATTENDANCE_THRESHOLD}%."
+        skips = ' &middot; '.join(f"skip {k}: {value:.1f}%" for k, value in enumerate(data['skip_k'][:6]) if k <= data['remaining'])
+        
+        return f"""
+                <div class="projection-section">
+                    <h4>End of Semester Projection</h4>
+                    <p>About {data['remaining']} lecture(s) remain. {verdict}</p>
+                    <p>Attend all: {data['attend_all']:.1f}% &middot; {skips}</p>
+                    <p>At your current pace: {data['mc_mean']:.1f}% (likely {data['mc_p10']:.1f}&ndash;{data['mc_p90']:.1f}%), {data['mc_prob_safe'] * 100:.0f}% chance of staying above {projection.ATTENDANCE_THRESHOLD}%.</p>
+                </div>
+"""
+    
+    def render_calendar_heatmap(self, subject):
+        """Render a compact week-by-weekday heatmap of a subject's lecture days"""
+        index = self.date_index.get(subject)
+        if not index:
+            return ''
+        
+        first_day = index['first_day']
+        # Pad so the first column starts on a Monday
+        lead = (first_day - 1) % 7
+        cells = ['<span class="heat-cell"></span>'] * lead
+        for offset, (p, a) in enumerate(zip(index['present'], index['absent'])):
+            if not p and not a:
+                cells.append('<span class="heat-cell"></span>')
+                continue
+            if a and p:
+                level = 'heat-mixed'
+            elif a:
+                level = 'heat-absent'
+            else:
+                level = 'heat-present'
+            day = date.fromordinal(first_day + offset).strftime(DATE_FORMAT)
+            cells.append(f'<span class="heat-cell {level}" title="{day}: {p} present, {a} absent"></span>')
+        
+        summary = self.get_calendar_summary(subject)
+        streaks = summary['streaks']
+        notes = [f"Longest streak: {streaks['longest']} day(s)", f"Current streak: {streaks['current']} day(s)"]
+        if summary['worst_week']:
+            week_start, (_, week_absent) = summary['worst_week']
+            notes.append(f"Most missed week: {week_start.strftime('%b %d')} ({week_absent} absent)")
+        
+        return f"""
+                <div class="calendar-section">
+                    <h4>Calendar</h4>
+                    <div class="heatmap">{''.join(cells)}</div>
+                    <div class="heatmap-notes">{' &middot; '.join(notes)}</div>
+                </div>
+"""
+    
+    def render_html_report(self):
+        """Render the minimal black and white HTML attendance report, or None without data"""
+        if not self.subjects:
+            return None
+        
         # Calculate overall statistics
         total_lectures = sum(s['total'] for s in self.subjects.values())
         total_present = sum(s['present'] for s in self.subjects.values())
@@ -453,6 +784,71 @@ class AttendanceCalculator:
             font-size: 0.85em;
         }}
         
+        .calendar-section {{
+            margin-top: 20px;
+        }}
+        
+        .calendar-section h4 {{
+            font-size: 0.85em;
+            font-weight: 600;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+            margin-bottom: 10px;
+            color: #666;
+        }}
+        
+        .heatmap {{
+            display: grid;
+            grid-template-rows: repeat(7, 11px);
+            grid-auto-flow: column;
+            grid-auto-columns: 11px;
+            gap: 2px;
+            overflow-x: auto;
+        }}
+        
+        .heat-cell {{
+            background: #f0f0f0;
+        }}
+        
+        .heat-present {{
+            background: #000;
+        }}
+        
+        .heat-mixed {{
+            background: #999;
+        }}
+        
+        .heat-absent {{
+            background: #ff9800;
+        }}
+        
+        .heatmap-notes {{
+            margin-top: 10px;
+            font-size: 0.85em;
+            color: #666;
+        }}
+        
+        .projection-section {{
+            margin-top: 20px;
+            padding: 15px;
+            border: 1px solid #e0e0e0;
+            font-size: 0.9em;
+        }}
+        
+        .projection-section h4 {{
+            font-size: 0.85em;
+            font-weight: 600;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+            margin-bottom: 10px;
+            color: #666;
+        }}
+        
+        .projection-section p + p {{
+            margin-top: 5px;
+            color: #666;
+        }}
+        
         .footer {{
             text-align: center;
             margin-top: 80px;
@@ -483,7 +879,7 @@ class AttendanceCalculator:
     <div class="container">
         <div class="header">
             <h1>Attendance Report</h1>
-            <p style="color: #999; font-size: 0.9em; margin-top: 10px;">Generated on {self.report_date}</p>
+            <p style="color: #999; font-size: 0.9em; margin-top: 10px;">Attendance as of {self.report_date}</p>
         </div>
         
         <div class="student-info">
@@ -585,6 +981,14 @@ class AttendanceCalculator:
                 </div>
 """
             
+            findings = self.validation.get(subject)
+            if findings and any(findings.values()):
+                html_content += f"""
+                <div class="status-message warning">
+                    Data check: {len(findings['duplicates'])} duplicate, {len(findings['overlaps'])} overlapping and {len(findings['out_of_order'])} out-of-order record(s) in the source.
+                </div>
+"""
+            
             # Add absent dates if any
             if data['absent'] > 0:
                 html_content += f"""
@@ -599,6 +1003,9 @@ class AttendanceCalculator:
                 </div>
 """
             
+            html_content += self.render_calendar_heatmap(subject)
+            html_content += self.render_projection(subject)
+            
             # Add calculator section
             html_content += f"""
                 <div class="calculator-section">
@@ -702,6 +1109,14 @@ class AttendanceCalculator:
     </script>
 </body>
 </html>"""
+        return html_content
+    
+    def generate_html_report(self, output_file='attendance_report.html'):
+        """Generate a minimal black and white HTML attendance report"""
+        html_content = self.render_html_report()
+        if html_content is None:
+            print("No data available to generate report.")
+            return
         
         # Write to file
         with open(output_file, 'w', encoding='utf-8') as f:
@@ -710,22 +1125,30 @@ class AttendanceCalculator:
         print(f"\nHTML report generated: {output_file}")
         return output_file
     
+    def render_csv(self):
+        """Render the per-lecture records as CSV text, or None without data"""
+        if not self.attendance_data:
+            return None
+        
+        df = pd.DataFrame(self.attendance_data)
+        df['subject_cleaned'] = df['course'].apply(self.clean_course_name)
+        return df.to_csv(index=False)
+    
     def export_to_csv(self, output_file='attendance_report.csv'):
         """Export attendance data to CSV"""
-        if not self.attendance_data:
+        csv_content = self.render_csv()
+        if csv_content is None:
             print("No data to export.")
             return
         
-        df = pd.DataFrame(self.attendance_data)
-        df['subject_cleaned'] = df['course'].apply(self.clean_course_name)
-        df.to_csv(output_file, index=False)
+        with open(output_file, 'w', encoding='utf-8', newline='') as f:
+            f.write(csv_content)
         print(f"Data exported to: {output_file}")
     
-    def export_summary_to_csv(self, output_file='attendance_summary.csv'):
-        """Export summary to CSV"""
+    def render_summary_csv(self):
+        """Render the per-subject summary as CSV text, or None without data"""
         if not self.subjects:
-            print("No summary data to export.")
-            return
+            return None
         
         summary_data = []
         for subject, data in self.subjects.items():
@@ -741,8 +1164,97 @@ class AttendanceCalculator:
         
         df = pd.DataFrame(summary_data)
         df = df.sort_values('Attendance %', ascending=False)
-        df.to_csv(output_file, index=False)
+        return df.to_csv(index=False)
+    
+    def export_summary_to_csv(self, output_file='attendance_summary.csv'):
+        """Export summary to CSV"""
+        csv_content = self.render_summary_csv()
+        if csv_content is None:
+            print("No summary data to export.")
+            return
+        
+        with open(output_file, 'w', encoding='utf-8', newline='') as f:
+            f.write(csv_content)
         print(f"Summary exported to: {output_file}")
+    
+    def render_json(self):
+        """Render subject stats, calendar rollups and projections as JSON text, or None without data"""
+        if not self.subjects:
+            return None
+        
+        subjects = {}
+        for subject, data in sorted(self.subjects.items()):
+            percentage = (data['present'] / data['total'] * 100) if data['total'] > 0 else 0
+            entry = {
+                'total': data['total'],
+                'present': data['present'],
+                'absent': data['absent'],
+                'percentage': round(percentage, 2),
+                'absent_dates': data['absent_dates']
+            }
+            calendar = self.get_calendar_summary(subject)
+            if calendar:
+                entry['calendar'] = {
+                    'weekly': [[day.isoformat(), p, a] for day, (p, a) in sorted(calendar['weekly'].items())],
+                    'monthly': [[day.strftime('%Y-%m'), p, a] for day, (p, a) in sorted(calendar['monthly'].items())],
+                    'streaks': calendar['streaks']
+                }
+            if subject in self.projection:
+                entry['projection'] = self.projection[subject]
+            if subject in self.validation:
+                entry['validation'] = self.validation[subject]
+            subjects[subject] = entry
+        
+        report = {
+            'student_name': self.student_name,
+            'sap_id': self.sap_id,
+            'program': self.program,
+            'batch': self.batch,
+            'report_date': self.report_date,
+            'subjects': subjects
+        }
+        return json.dumps(report, indent=2)
+    
+    def export_to_json(self, output_file='attendance_report.json'):
+        """Export subject stats, calendar rollups and projections to JSON"""
+        json_content = self.render_json()
+        if json_content is None:
+            print("No summary data to export.")
+            return
+        
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(json_content)
+        print(f"JSON exported to: {output_file}")
+
+
+def process_pdf(pdf_path, output_dir='.', deduplicate=False, timetable=None, semester_end=None, workers=1,
+                seed=None):
+    """Run the full extract, aggregate and report pipeline for one PDF.
+
+    Reports are written atomically into output_dir with the usual file names, and
+    files whose content did not change are left alone. Returns a dict of output
+    paths keyed by report type, or None if the PDF could not be read. Projections
+    are seeded from the data unless seed is given, so reruns render identically.
+    """
+    # Create calculator instance
+    calc = AttendanceCalculator(pdf_path)
+    
+    # Extract data
+    if not calc.extract_data(workers=workers):
+        return None
+    
+    # Check for duplicate or overlapping lectures
+    calc.validate_records(deduplicate=deduplicate)
+    
+    # Calculate attendance
+    calc.calculate_subject_attendance()
+    
+    # Project the end of the semester if we know what is left
+    if timetable or semester_end:
+        calc.project_attendance(timetable, semester_end, seed=seed)
+    
+    # Generate the HTML, CSV and JSON reports
+    return ExportPipeline().run(calc, output_dir)
 
 
 def main():
@@ -750,11 +1262,14 @@ def main():
     print("STUDENT ATTENDANCE CALCULATOR")
     print("=" * 80 + "\n")
     
-    # Check if PDF path is provided
-    if len(sys.argv) > 1:
-        pdf_path = sys.argv[1]
-    else:
-        pdf_path = "ZSVKM_STUDENT_ATTENDANCE.pdf"
+    parser = argparse.ArgumentParser(description="Calculate attendance from a student attendance PDF")
+    parser.add_argument('pdf_file', nargs='?', default="ZSVKM_STUDENT_ATTENDANCE.pdf")
+    parser.add_argument('--timetable', help="JSON file with expected remaining lectures per subject")
+    parser.add_argument('--semester-end', help="Last day of the semester (YYYY-MM-DD), used to extrapolate remaining lectures")
+    parser.add_argument('--dedupe', action='store_true', help="Drop exact duplicate lecture records before calculating")
+    parser.add_argument('--workers', type=int, default=1, help="Worker processes for page extraction (default: 1)")
+    args = parser.parse_args()
+    pdf_path = args.pdf_file
     
     # Check if file exists
     if not Path(pdf_path).exists():
@@ -762,25 +1277,20 @@ def main():
         print(f"\nUsage: python attendance_calculator.py [pdf_file]")
         sys.exit(1)
     
-    # Create calculator instance
-    calc = AttendanceCalculator(pdf_path)
+    timetable, semester_end = {}, None
+    if args.timetable:
+        timetable, semester_end = projection.load_timetable(args.timetable)
+    if args.semester_end:
+        semester_end = datetime.strptime(args.semester_end, "%Y-%m-%d").date()
     
-    # Extract data
-    if not calc.extract_data():
+    outputs = process_pdf(pdf_path, '.', deduplicate=args.dedupe, timetable=timetable, semester_end=semester_end,
+                          workers=args.workers)
+    if not outputs:
         sys.exit(1)
     
-    # Calculate attendance
-    calc.calculate_subject_attendance()
-    
-    # Generate HTML report
-    html_file = calc.generate_html_report('attendance_report.html')
-    
-    # Also export CSV files
-    calc.export_to_csv()
-    calc.export_summary_to_csv()
-    
     print("\nAnalysis complete!")
-    print(f"Open '{html_file}' in your browser to view the report.\n")
+    if 'html' in outputs:
+        print(f"Open '{outputs['html']}' in your browser to view the report.\n")
 
 
 if __name__ == "__main__":
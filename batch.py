@@ -0,0 +1,184 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+from pathlib import Path
+
+from cohort import collect_pdfs
+from watcher import file_sha256, publish_pdf
+
+JOURNAL_FILE = 'batch_journal.jsonl'
+
+
+class BatchJournal:
+    def __init__(self, path, fsync_every=10):
+        self.path = Path(path)
+        self.fsync_every = fsync_every
+        # (path, sha256) -> latest entry for that input
+        self.entries = {}
+        self.unsynced = 0
+        self.file = None
+
+    def load(self):
+        """Replay the journal; a line cut short by a crash is ignored"""
+        if not self.path.exists():
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self.entries[(entry['path'], entry['sha256'])] = entry
+
+    def open(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.path, 'a', encoding='utf-8')
+        # Start on a fresh line if the previous run died mid-write
+        if self.file.tell() > 0:
+            with open(self.path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    self.file.write('\n')
+
+    def record(self, entry):
+        """Append an entry, forcing it to disk every fsync_every entries"""
+        self.entries[(entry['path'], entry['sha256'])] = entry
+        self.file.write(json.dumps(entry) + '\n')
+        self.unsynced += 1
+        if self.unsynced >= self.fsync_every:
+            self.sync()
+
+    def sync(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.unsynced = 0
+
+    def close(self):
+        if self.file:
+            self.sync()
+            self.file.close()
+            self.file = None
+
+    def status(self, path, digest):
+        """Latest entry recorded for this exact input, or None"""
+        return self.entries.get((path, digest))
+
+
+def report_dir_name(pdf_path, digest):
+    """Output folder for a PDF: its name plus a content hash prefix, so same-named inputs from different folders do not collide"""
+    return f"{Path(pdf_path).stem}-{digest[:8]}"
+
+
+def process_one(pdf_path, output_dir, deduplicate=False, digest=None):
+    """Worker: run the pipeline for one PDF and time it"""
+    started = time.time()
+    try:
+        digest = digest or file_sha256(pdf_path)
+        outputs = publish_pdf(pdf_path, Path(output_dir) / report_dir_name(pdf_path, digest), deduplicate)
+        error = None if outputs else "could not extract data"
+    except Exception as e:
+        outputs, error = None, str(e)
+    return outputs, error, started, time.time() - started
+
+
+def run_batch(pdf_paths, output_dir, journal_path=None, workers=2, retries=3, fsync_every=10, deduplicate=False):
+    """Process many PDFs, skipping inputs the journal already marks as done.
+
+    Failed inputs are retried until they have been attempted `retries` times in
+    total, counting attempts from earlier runs.
+    """
+    # Absolute, so the output paths the journal records still resolve from another working directory
+    output_dir = Path(output_dir).resolve()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    journal = BatchJournal(journal_path or output_dir / JOURNAL_FILE, fsync_every)
+    journal.load()
+
+    todo = []
+    skipped = gave_up = 0
+    for pdf_path in pdf_paths:
+        # Resolved paths keep journal keys stable however the inputs were typed
+        pdf_path = str(Path(pdf_path).resolve())
+        digest = file_sha256(pdf_path)
+        entry = journal.status(pdf_path, digest)
+        if entry and entry['status'] == 'done' and all(Path(p).exists() for p in entry['outputs'].values()):
+            skipped += 1
+            continue
+        attempts = entry['attempt'] if entry and entry['status'] == 'failed' else 0
+        if attempts >= retries:
+            print(f"Giving up on {pdf_path} after {attempts} failed attempt(s)")
+            gave_up += 1
+            continue
+        todo.append((pdf_path, digest, attempts))
+    print(f"{len(todo)} to process, {skipped} already done")
+
+    done, failed = 0, gave_up
+    journal.open()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            def submit(pdf_path, digest):
+                return executor.submit(process_one, pdf_path, str(output_dir), deduplicate, digest)
+
+            pending = {submit(item[0], item[1]): item for item in todo}
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    pdf_path, digest, attempts = pending.pop(future)
+                    outputs, error, started, seconds = future.result()
+                    attempts += 1
+                    journal.record({
+                        'path': pdf_path,
+                        'sha256': digest,
+                        'status': 'failed' if error else 'done',
+                        'attempt': attempts,
+                        'started': datetime.fromtimestamp(started).isoformat(timespec='seconds'),
+                        'seconds': round(seconds, 3),
+                        'outputs': outputs or {},
+                        'error': error
+                    })
+                    if not error:
+                        done += 1
+                    elif attempts < retries:
+                        print(f"Retrying {pdf_path} ({error})")
+                        pending[submit(pdf_path, digest)] = (pdf_path, digest, attempts)
+                    else:
+                        failed += 1
+                        print(f"Failed {pdf_path} after {attempts} attempt(s): {error}")
+    finally:
+        journal.close()
+
+    print(f"\nBatch complete: {done} processed, {skipped} skipped, {failed} failed")
+    return done, skipped, failed
+
+
+def main():
+    print("\n" + "=" * 80)
+    print("BATCH ATTENDANCE PROCESSING")
+    print("=" * 80 + "\n")
+
+    parser = argparse.ArgumentParser(description="Process many attendance PDFs, resuming where a previous run stopped")
+    parser.add_argument('inputs', nargs='+', help="PDF files or folders of PDFs")
+    parser.add_argument('--output', default='reports', help="Folder for per-student reports (default: reports)")
+    parser.add_argument('--journal', help=f"Journal file (default: <output>/{JOURNAL_FILE})")
+    parser.add_argument('--workers', type=int, default=2, help="Number of worker processes")
+    parser.add_argument('--retries', type=int, default=3, help="Attempts per PDF before giving up")
+    parser.add_argument('--fsync-every', type=int, default=10, help="Force the journal to disk every N entries")
+    parser.add_argument('--dedupe', action='store_true', help="Drop exact duplicate lecture records before calculating")
+    args = parser.parse_args()
+
+    pdfs = collect_pdfs(args.inputs)
+    if not pdfs:
+        print("Error: No PDF files found")
+        sys.exit(1)
+
+    _, _, failed = run_batch(pdfs, args.output, args.journal, workers=args.workers, retries=args.retries,
+                             fsync_every=args.fsync_every, deduplicate=args.dedupe)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+import argparse
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from attendance_calculator import AttendanceCalculator
+from cohort_dashboard import export_dashboard
+from shared_pdf import pack_records, unpack_records
+
+
+def extract_student(pdf_path):
+    """Worker: extract one PDF and return student info plus packed records with cleaned subject names"""
+    calc = AttendanceCalculator(pdf_path)
+    if not calc.extract_data():
+        return None
+    calc.validate_records(deduplicate=True)
+    # The course column carries the cleaned subject name from here on
+    records = [dict(record, course=calc.clean_course_name(record['course'])) for record in calc.attendance_data]
+    info = {
+        'source': str(pdf_path),
+        'student_name': calc.student_name,
+        'sap_id': calc.sap_id,
+        'program': calc.program,
+        'batch': calc.batch
+    }
+    return info, pack_records(records)
+
+
+class CohortAggregator:
+    def __init__(self):
+        self.students = []
+        # (subject, date, start_time) -> slot column
+        self.slot_ids = {}
+        self.slots = []
+        self.subject_ids = {}
+        self.subjects = []
+        self.slot_subject = array('i')
+        # Sparse (student x slot) matrix in coordinate form, 1 = absent, 0 = present
+        self.rows = array('i')
+        self.cols = array('i')
+        self.absent = array('b')
+
+    def add_student(self, info, records):
+        """Add one student's records, where 'course' already holds the cleaned subject name"""
+        row = len(self.students)
+        self.students.append(info)
+        for record in records:
+            if record['attendance'] not in ('P', 'A'):
+                continue
+            key = (record['course'], record['date'], record['start_time'])
+            col = self.slot_ids.get(key)
+            if col is None:
+                col = self.slot_ids[key] = len(self.slots)
+                self.slots.append(key)
+                subject = self.subject_ids.get(record['course'])
+                if subject is None:
+                    subject = self.subject_ids[record['course']] = len(self.subjects)
+                    self.subjects.append(record['course'])
+                self.slot_subject.append(subject)
+            self.rows.append(row)
+            self.cols.append(col)
+            self.absent.append(record['attendance'] == 'A')
+
+    def add_calculator(self, calc):
+        """Add a student from an AttendanceCalculator that has already extracted its data"""
+        info = {
+            'source': str(calc.pdf_path),
+            'student_name': calc.student_name,
+            'sap_id': calc.sap_id,
+            'program': calc.program,
+            'batch': calc.batch
+        }
+        self.add_student(info, [dict(record, course=calc.clean_course_name(record['course']))
+                                for record in calc.attendance_data])
+
+    def add_pdfs(self, pdf_paths, workers=4):
+        """Extract many PDFs in parallel and add each student"""
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for pdf_path, result in zip(pdf_paths, executor.map(extract_student, pdf_paths, chunksize=4)):
+                if result is None:
+                    print(f"Skipping {pdf_path}: could not extract data")
+                    continue
+                info, packed = result
+                self.add_student(info, unpack_records(packed))
+
+    def _arrays(self):
+        return (np.frombuffer(self.rows, dtype=np.int32),
+                np.frombuffer(self.cols, dtype=np.int32),
+                np.frombuffer(self.absent, dtype=np.int8).astype(np.float64))
+
+    def slot_absence_rates(self):
+        """Students marked for each slot and the share of them absent"""
+        _, cols, absent = self._arrays()
+        enrolled = np.bincount(cols, minlength=len(self.slots))
+        absences = np.bincount(cols, weights=absent, minlength=len(self.slots))
+        rates = np.divide(absences, enrolled, out=np.zeros(len(self.slots)), where=enrolled > 0)
+        return enrolled, absences, rates
+
+    def mass_absences(self, threshold=0.8, min_students=5):
+        """Slots where most of the class was absent, likely cancelled or mis-marked sessions"""
+        enrolled, absences, rates = self.slot_absence_rates()
+        flagged = np.flatnonzero((rates >= threshold) & (enrolled >= min_students))
+        flagged = flagged[np.argsort(-rates[flagged], kind='stable')]
+        return pd.DataFrame({
+            'Subject': [self.slots[i][0] for i in flagged],
+            'Date': [self.slots[i][1] for i in flagged],
+            'Start Time': [self.slots[i][2] for i in flagged],
+            'Students': enrolled[flagged],
+            'Absent': absences[flagged].astype(np.int64),
+            'Absence %': np.round(rates[flagged] * 100, 2)
+        })
+
+    def subject_matrix(self):
+        """Dense (student x subject) arrays of present and total lectures"""
+        rows, cols, absent = self._arrays()
+        num_subjects = len(self.subjects)
+        cells = rows.astype(np.int64) * num_subjects + np.frombuffer(self.slot_subject, dtype=np.int32)[cols]
+        size = len(self.students) * num_subjects
+        total = np.bincount(cells, minlength=size).reshape(len(self.students), num_subjects)
+        present = total - np.bincount(cells, weights=absent, minlength=size).reshape(total.shape).astype(np.int64)
+        return present, total
+
+    def student_rankings(self):
+        """Per-student overall and weakest-subject attendance, ranked best first"""
+        present, total = self.subject_matrix()
+        overall_total = total.sum(axis=1)
+        overall = np.divide(present.sum(axis=1) * 100, overall_total,
+                            out=np.zeros(len(self.students)), where=overall_total > 0)
+        by_subject = np.divide(present * 100, total, out=np.full(total.shape, np.inf), where=total > 0)
+        weakest = by_subject.argmin(axis=1) if self.subjects else np.zeros(len(self.students), dtype=np.int64)
+        weakest_pct = by_subject[np.arange(len(self.students)), weakest] if self.subjects else np.full(len(self.students), np.inf)
+
+        # Ties share the better rank
+        sorted_desc = np.sort(-overall)
+        rank = np.searchsorted(sorted_desc, -overall, side='left') + 1
+        order = np.argsort(rank, kind='stable')
+
+        df = pd.DataFrame({
+            'Rank': rank[order],
+            'Name': [self.students[i]['student_name'] for i in order],
+            'SAP ID': [self.students[i]['sap_id'] for i in order],
+            'Program': [self.students[i]['program'] for i in order],
+            'Batch': [self.students[i]['batch'] for i in order],
+            'Total Lectures': overall_total[order],
+            'Attendance %': np.round(overall[order], 2),
+            'Weakest Subject': ['' if np.isinf(weakest_pct[i]) else self.subjects[weakest[i]] for i in order],
+            'Weakest %': np.round(np.where(np.isinf(weakest_pct), 0, weakest_pct)[order], 2)
+        })
+        for j, subject in enumerate(self.subjects):
+            df[subject] = np.round(by_subject[order, j], 2)
+        # Subjects a student does not take show as empty cells
+        return df.replace(np.inf, np.nan)
+
+    def export(self, output_dir='.', threshold=0.8, min_students=5):
+        """Write cohort rankings and flagged slots to CSV"""
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        rankings_file = output_dir / 'cohort_rankings.csv'
+        slots_file = output_dir / 'cohort_mass_absences.csv'
+        self.student_rankings().to_csv(rankings_file, index=False)
+        self.mass_absences(threshold, min_students).to_csv(slots_file, index=False)
+        print(f"Rankings exported to: {rankings_file}")
+        print(f"Mass absences exported to: {slots_file}")
+        return str(rankings_file), str(slots_file)
+
+
+def collect_pdfs(paths):
+    """Expand folders into the PDFs they contain"""
+    pdfs = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            pdfs.extend(sorted(path.glob('*.pdf')))
+        elif path.exists():
+            pdfs.append(path)
+        else:
+            print(f"Warning: File not found: {path}")
+    return [str(pdf) for pdf in pdfs]
+
+
+def main():
+    print("\n" + "=" * 80)
+    print("COHORT ATTENDANCE ANALYSIS")
+    print("=" * 80 + "\n")
+
+    parser = argparse.ArgumentParser(description="Aggregate attendance across many student PDFs")
+    parser.add_argument('inputs', nargs='+', help="PDF files or folders of PDFs")
+    parser.add_argument('--output', default='.', help="Folder for cohort CSV files")
+    parser.add_argument('--workers', type=int, default=4, help="Worker processes for PDF extraction")
+    parser.add_argument('--threshold', type=float, default=0.8, help="Share of absent students that flags a slot")
+    parser.add_argument('--min-students', type=int, default=5, help="Minimum class size for a slot to be flagged")
+    parser.add_argument('--dashboard', choices=['batch', 'program'],
+                        help="Also write a cohort dashboard sharded by batch or program")
+    args = parser.parse_args()
+
+    pdfs = collect_pdfs(args.inputs)
+    if not pdfs:
+        print("Error: No PDF files found")
+        sys.exit(1)
+
+    cohort = CohortAggregator()
+    cohort.add_pdfs(pdfs, workers=args.workers)
+    print(f"\n{len(cohort.students)} students, {len(cohort.slots)} lecture slots, {len(cohort.rows)} records")
+
+    flagged = cohort.mass_absences(args.threshold, args.min_students)
+    if len(flagged):
+        print(f"\nSlots with at least {args.threshold * 100:.0f}% of the class absent:")
+        print(flagged.head(20).to_string(index=False))
+
+    cohort.export(args.output, args.threshold, args.min_students)
+    if args.dashboard:
+        export_dashboard(cohort, Path(args.output) / 'dashboard', group_by=args.dashboard)
+    print("\nAnalysis complete!\n")
+
+
+if __name__ == "__main__":
+    main()
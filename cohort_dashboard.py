@@ -0,0 +1,305 @@
+import json
+import re
+from pathlib import Path
+
+import numpy as np
+
+from projection import ATTENDANCE_THRESHOLD
+
+
+def shard_slug(key, used):
+    """File-safe, unique shard name for a program or batch"""
+    slug = re.sub(r'[^A-Za-z0-9]+', '-', key).strip('-').lower() or 'unassigned'
+    candidate, n = slug, 2
+    while candidate in used:
+        candidate = f"{slug}-{n}"
+        n += 1
+    used.add(candidate)
+    return candidate
+
+
+def export_dashboard(cohort, output_dir='dashboard', group_by='batch'):
+    """Write a lightweight cohort dashboard: one HTML shell plus a JSON shard per program or batch.
+
+    The shell only embeds the shard manifest, so its size does not grow with the
+    number of students. Shards are fetched when selected and rendered into a
+    virtualized table.
+    """
+    output_dir = Path(output_dir)
+    shard_dir = output_dir / 'shards'
+    shard_dir.mkdir(parents=True, exist_ok=True)
+
+    rankings = cohort.student_rankings()
+    columns = list(rankings.columns)
+    subjects = list(cohort.subjects)
+    group_column = 'Program' if group_by == 'program' else 'Batch'
+
+    manifest = []
+    used = set()
+    for key, group in rankings.groupby(group_column, sort=True):
+        slug = shard_slug(key, used)
+        values = group.to_numpy(dtype=object)
+        # JSON has no NaN, subjects a student does not take become null
+        rows = [[None if isinstance(v, float) and np.isnan(v) else v for v in row] for row in values.tolist()]
+
+        subject_stats = []
+        for subject in subjects:
+            scores = group[subject].to_numpy(dtype=np.float64)
+            taken = scores[~np.isnan(scores)]
+            subject_stats.append({
+                'subject': subject,
+                'students': int(taken.size),
+                'average': round(float(taken.mean()), 2) if taken.size else None,
+                'below_threshold': int((taken < ATTENDANCE_THRESHOLD).sum())
+            })
+
+        shard = {'key': key, 'columns': columns, 'rows': rows, 'subjects': subject_stats}
+        with open(shard_dir / f"{slug}.json", 'w', encoding='utf-8') as f:
+            json.dump(shard, f, separators=(',', ':'), default=lambda v: v.item())
+        manifest.append({'key': key or 'Unassigned', 'file': f"shards/{slug}.json", 'students': len(rows)})
+
+    html_file = output_dir / 'index.html'
+    with open(html_file, 'w', encoding='utf-8') as f:
+        f.write(DASHBOARD_TEMPLATE
+                .replace('__MANIFEST__', json.dumps(manifest).replace('</', '<\\/'))
+                .replace('__GROUP__', group_column)
+                .replace('__THRESHOLD__', str(ATTENDANCE_THRESHOLD)))
+
+    print(f"Dashboard generated: {html_file} ({len(manifest)} shard(s))")
+    print(f"Serve it over HTTP to load shards, e.g. python -m http.server -d {output_dir}")
+    return str(html_file)
+
+
+DASHBOARD_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Cohort Attendance Dashboard</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif;
+            background: #ffffff;
+            color: #000000;
+            line-height: 1.6;
+            padding: 40px 20px;
+        }
+        .container { max-width: 1200px; margin: 0 auto; }
+        .header {
+            text-align: center;
+            margin-bottom: 40px;
+            padding-bottom: 30px;
+            border-bottom: 1px solid #e0e0e0;
+        }
+        .header h1 { font-size: 2.2em; font-weight: 300; letter-spacing: -0.5px; }
+        .controls { display: flex; gap: 15px; flex-wrap: wrap; margin-bottom: 25px; align-items: center; }
+        .controls label { font-size: 0.9em; color: #666; }
+        .controls select, .controls input {
+            padding: 8px 12px;
+            border: 1px solid #ccc;
+            background: white;
+            font-size: 1em;
+        }
+        .subject-stats {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
+            gap: 15px;
+            margin-bottom: 30px;
+        }
+        .stat-item { padding: 15px; background: #fafafa; border-left: 2px solid #000; }
+        .stat-item-label { font-size: 0.75em; text-transform: uppercase; letter-spacing: 1px; color: #666; }
+        .stat-item-value { font-size: 1.6em; font-weight: 300; }
+        .stat-item-note { font-size: 0.8em; color: #999; }
+        .table-head, .table-row { display: grid; align-items: center; }
+        .table-head {
+            font-size: 0.7em;
+            text-transform: uppercase;
+            letter-spacing: 1px;
+            color: #666;
+            border-bottom: 1px solid #000;
+            padding: 8px 0;
+        }
+        .table-head span { cursor: pointer; padding: 0 8px; }
+        .viewport { position: relative; height: 600px; overflow-y: auto; border-bottom: 1px solid #e0e0e0; }
+        .table-row {
+            position: absolute;
+            left: 0;
+            right: 0;
+            height: 32px;
+            font-size: 0.85em;
+            border-bottom: 1px solid #f0f0f0;
+        }
+        .table-row span { padding: 0 8px; overflow: hidden; white-space: nowrap; text-overflow: ellipsis; }
+        .low { color: #ff9800; font-weight: 600; }
+        .empty { color: #999; padding: 40px; text-align: center; }
+        .footer {
+            text-align: center;
+            margin-top: 60px;
+            padding-top: 30px;
+            border-top: 1px solid #e0e0e0;
+            color: #999;
+            font-size: 0.85em;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Cohort Attendance</h1>
+        </div>
+
+        <div class="controls">
+            <label for="shard">__GROUP__</label>
+            <select id="shard"></select>
+            <input type="search" id="filter" placeholder="Filter by name or SAP ID" />
+            <span id="count" style="color: #999; font-size: 0.9em;"></span>
+        </div>
+
+        <div class="subject-stats" id="subjects"></div>
+
+        <div class="table-head" id="head"></div>
+        <div class="viewport" id="viewport"><div id="spacer"></div></div>
+
+        <div class="footer">
+            <p>Rows are rendered on demand; each __GROUP__ is loaded only when selected.</p>
+        </div>
+    </div>
+
+    <script>
+        const MANIFEST = __MANIFEST__;
+        const THRESHOLD = __THRESHOLD__;
+        const ROW_HEIGHT = 32;
+        const OVERSCAN = 10;
+        const cache = {};
+        let shard = null;
+        let rows = [];
+        let sortColumn = 0;
+        let sortAscending = true;
+
+        const select = document.getElementById('shard');
+        const filter = document.getElementById('filter');
+        const viewport = document.getElementById('viewport');
+        const spacer = document.getElementById('spacer');
+
+        MANIFEST.forEach((entry, i) => {
+            const option = document.createElement('option');
+            option.value = i;
+            option.textContent = entry.key + ' (' + entry.students + ')';
+            select.appendChild(option);
+        });
+
+        function escapeHtml(value) {
+            return String(value).replace(/[&<>"]/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})[c]);
+        }
+
+        function isPercentColumn(name) {
+            return name.endsWith('%') || shard.subjects.some(s => s.subject === name);
+        }
+
+        function loadShard(i) {
+            const entry = MANIFEST[i];
+            if (!entry) return;
+            const ready = cache[entry.file] || fetch(entry.file).then(response => response.json());
+            cache[entry.file] = ready;
+            ready.then(data => {
+                shard = data;
+                renderSubjects();
+                renderHead();
+                applyFilter();
+            }).catch(() => {
+                spacer.style.height = 'auto';
+                spacer.innerHTML = '<div class="empty">Could not load ' + escapeHtml(entry.file) + '. Open this page through a web server.</div>';
+            });
+        }
+
+        function renderSubjects() {
+            document.getElementById('subjects').innerHTML = shard.subjects.map(s =>
+                '<div class="stat-item"><div class="stat-item-label">' + escapeHtml(s.subject || 'Other') + '</div>' +
+                '<div class="stat-item-value">' + (s.average === null ? '-' : s.average.toFixed(1) + '%') + '</div>' +
+                '<div class="stat-item-note">' + s.below_threshold + ' of ' + s.students + ' below ' + THRESHOLD + '%</div></div>'
+            ).join('');
+        }
+
+        function gridTemplate() {
+            return '60px 1.5fr 1fr 1fr 0.7fr 0.7fr 0.8fr 1.5fr 0.7fr repeat(' + (shard.columns.length - 9) + ', 0.8fr)';
+        }
+
+        function renderHead() {
+            const head = document.getElementById('head');
+            head.style.gridTemplateColumns = gridTemplate();
+            head.innerHTML = shard.columns.map((name, i) =>
+                '<span data-column="' + i + '" title="' + escapeHtml(name) + '">' + escapeHtml(name || 'Other') + '</span>'
+            ).join('');
+        }
+
+        function applyFilter() {
+            const term = filter.value.trim().toLowerCase();
+            rows = term
+                ? shard.rows.filter(row => String(row[1]).toLowerCase().includes(term) || String(row[2]).toLowerCase().includes(term))
+                : shard.rows.slice();
+            sortRows();
+        }
+
+        function sortRows() {
+            const direction = sortAscending ? 1 : -1;
+            rows.sort((a, b) => {
+                const x = a[sortColumn], y = b[sortColumn];
+                if (x === y) return 0;
+                if (x === null) return 1;
+                if (y === null) return -1;
+                return (x < y ? -1 : 1) * direction;
+            });
+            document.getElementById('count').textContent = rows.length + ' student(s)';
+            spacer.style.height = (rows.length * ROW_HEIGHT) + 'px';
+            viewport.scrollTop = 0;
+            renderRows();
+        }
+
+        function formatCell(value, name) {
+            if (value === null) return '<span>-</span>';
+            if (typeof value === 'number' && isPercentColumn(name)) {
+                return '<span class="' + (value < THRESHOLD ? 'low' : '') + '">' + value.toFixed(1) + '</span>';
+            }
+            return '<span>' + escapeHtml(value) + '</span>';
+        }
+
+        function renderRows() {
+            if (!shard) return;
+            // Only the rows inside the viewport (plus a small margin) exist in the DOM
+            const first = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - OVERSCAN);
+            const last = Math.min(rows.length, Math.ceil((viewport.scrollTop + viewport.clientHeight) / ROW_HEIGHT) + OVERSCAN);
+            const template = gridTemplate();
+            let html = '';
+            for (let i = first; i < last; i++) {
+                html += '<div class="table-row" style="top:' + (i * ROW_HEIGHT) + 'px;grid-template-columns:' + template + '">' +
+                    rows[i].map((value, j) => formatCell(value, shard.columns[j])).join('') + '</div>';
+            }
+            spacer.innerHTML = html;
+        }
+
+        let scheduled = false;
+        viewport.addEventListener('scroll', () => {
+            if (scheduled) return;
+            scheduled = true;
+            requestAnimationFrame(() => { scheduled = false; renderRows(); });
+        });
+        document.getElementById('head').addEventListener('click', event => {
+            const column = event.target.dataset.column;
+            if (column === undefined) return;
+            sortAscending = Number(column) === sortColumn ? !sortAscending : true;
+            sortColumn = Number(column);
+            sortRows();
+        });
+        filter.addEventListener('input', applyFilter);
+        select.addEventListener('change', () => loadShard(select.value));
+
+        if (MANIFEST.length) {
+            loadShard(0);
+        } else {
+            spacer.innerHTML = '<div class="empty">No students in this cohort.</div>';
+        }
+    </script>
+</body>
+</html>
+"""
@@ -0,0 +1,134 @@
+import hashlib
+import json
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+MANIFEST_FILE = 'manifest.json'
+
+
+def write_if_changed(path, content):
+    """Write content atomically, skipping the write if the file already holds the same bytes.
+
+    Returns (sha256, written). The data goes to a temp file in the same folder
+    and is renamed over the target, so readers see either the old or new file.
+    """
+    data = content.encode('utf-8')
+    digest = hashlib.sha256(data).hexdigest()
+    path = Path(path)
+
+    # Keep the permissions of the file being replaced; mkstemp would make it private
+    mode = 0o644
+    try:
+        with open(path, 'rb') as f:
+            if hashlib.sha256(f.read()).hexdigest() == digest:
+                return digest, False
+            mode = os.fstat(f.fileno()).st_mode & 0o777
+    except FileNotFoundError:
+        pass
+
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix='.tmp', dir=path.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return digest, True
+
+
+class ExportSink(ABC):
+    """One report output: a name, a default file name and a render step"""
+    name = None
+    filename = None
+
+    def __init__(self, filename=None):
+        if filename:
+            self.filename = filename
+
+    @abstractmethod
+    def render(self, calc):
+        """Return the file content as text, or None if there is nothing to write"""
+
+
+class HtmlSink(ExportSink):
+    name = 'html'
+    filename = 'attendance_report.html'
+
+    def render(self, calc):
+        return calc.render_html_report()
+
+
+class CsvSink(ExportSink):
+    name = 'csv'
+    filename = 'attendance_report.csv'
+
+    def render(self, calc):
+        return calc.render_csv()
+
+
+class SummarySink(ExportSink):
+    name = 'summary'
+    filename = 'attendance_summary.csv'
+
+    def render(self, calc):
+        return calc.render_summary_csv()
+
+
+class JsonSink(ExportSink):
+    name = 'json'
+    filename = 'attendance_report.json'
+
+    def render(self, calc):
+        return calc.render_json()
+
+
+DEFAULT_SINKS = (HtmlSink, CsvSink, SummarySink, JsonSink)
+
+
+class ExportPipeline:
+    def __init__(self, sinks=None, workers=None):
+        self.sinks = list(sinks) if sinks is not None else [sink() for sink in DEFAULT_SINKS]
+        self.workers = workers or len(self.sinks) or 1
+
+    def _export(self, sink, calc, output_dir):
+        content = sink.render(calc)
+        if content is None:
+            return sink, None, None, False
+        path = output_dir / sink.filename
+        digest, written = write_if_changed(path, content)
+        return sink, str(path), digest, written
+
+    def run(self, calc, output_dir='.'):
+        """Render every sink concurrently from the same calculator, then write a manifest.
+
+        Sinks only read the calculator, so they share one aggregate without copies.
+        Returns a dict of output paths keyed by sink name, plus 'manifest'.
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results = list(executor.map(lambda sink: self._export(sink, calc, output_dir), self.sinks))
+
+        outputs = {}
+        manifest = {'source': str(calc.pdf_path), 'outputs': {}}
+        for sink, path, digest, written in results:
+            if path is None:
+                print(f"Skipped {sink.name}: no data")
+                continue
+            outputs[sink.name] = path
+            manifest['outputs'][sink.name] = {'file': sink.filename, 'sha256': digest}
+            print(f"{'Wrote' if written else 'Unchanged'}: {path}")
+
+        # No timestamps, so an unchanged run leaves the manifest untouched as well
+        manifest_path = output_dir / MANIFEST_FILE
+        write_if_changed(manifest_path, json.dumps(manifest, indent=2, sort_keys=True))
+        outputs['manifest'] = str(manifest_path)
+        return outputs
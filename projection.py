@@ -0,0 +1,125 @@
+import hashlib
+import json
+from datetime import datetime
+import numpy as np
+
+ATTENDANCE_THRESHOLD = 80
+
+# Upper bound on simulated values held in memory at once (trials x cells)
+MONTE_CARLO_BUDGET = 4_000_000
+
+
+def load_timetable(path):
+    """Load expected remaining lectures per subject from a JSON file.
+
+    Accepts either a plain {subject: lectures} mapping or an object with a
+    "remaining" mapping and an optional "semester_end" date (YYYY-MM-DD).
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    if 'remaining' in config:
+        remaining = config['remaining']
+        semester_end = config.get('semester_end')
+    else:
+        remaining = config
+        semester_end = None
+
+    if semester_end:
+        semester_end = datetime.strptime(semester_end, "%Y-%m-%d").date()
+    return {subject: int(count) for subject, count in remaining.items()}, semester_end
+
+
+def extrapolate_remaining(index, semester_end):
+    """Estimate lectures left until semester_end from the past lecture frequency in a date index"""
+    if not index:
+        return 0
+
+    num_days = len(index['present'])
+    held = sum(index['present']) + sum(index['absent'])
+    last_day = index['first_day'] + num_days - 1
+    days_left = semester_end.toordinal() - last_day
+    if days_left <= 0:
+        return 0
+    # Anything shorter than a week over-weights a single busy day
+    per_day = held / max(num_days, 7)
+    return int(round(per_day * days_left))
+
+
+def input_seed(*arrays):
+    """Stable Monte Carlo seed derived from the projection inputs, so the same data gives the same report"""
+    digest = hashlib.sha256()
+    for values in arrays:
+        digest.update(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+    return int.from_bytes(digest.digest()[:8], 'little')
+
+
+def project_attendance(present, total, remaining, max_skip=10, trials=1000,
+                       threshold=ATTENDANCE_THRESHOLD, attend_rate=None, seed=None):
+    """Project end-of-semester attendance under several scenarios at once.
+
+    present, total and remaining are arrays of the same shape, typically
+    (subjects,) for one student or (students, subjects) for a cohort. Returns a
+    dict of arrays: attend_all and safe_skips share the input shape, skip_k has
+    a leading axis for k = 0..max_skip, and the mc_* entries summarise a Monte
+    Carlo run where each remaining lecture is attended with attend_rate
+    (defaulting to the historical present/total ratio). Without an explicit seed
+    the simulation is seeded from the inputs, so results are reproducible.
+    """
+    present = np.asarray(present, dtype=np.float64)
+    total = np.asarray(total, dtype=np.float64)
+    remaining = np.asarray(remaining, dtype=np.int64)
+    final_total = total + remaining
+
+    def as_percentage(attended):
+        return np.divide(attended * 100, final_total, out=np.zeros(np.broadcast(attended, final_total).shape),
+                         where=final_total > 0)
+
+    attend_all = as_percentage(present + remaining)
+
+    # Skip k of the remaining lectures, k along a new leading axis
+    k = np.arange(max_skip + 1).reshape((-1,) + (1,) * remaining.ndim)
+    skip_k = as_percentage(present + remaining - np.minimum(k, remaining))
+
+    # Most lectures that can still be missed while finishing at the threshold
+    slack = np.floor(present + remaining - threshold / 100 * final_total + 1e-9)
+    safe_skips = np.clip(slack, 0, remaining).astype(np.int64)
+
+    if seed is None:
+        seed = input_seed(present, total, remaining)
+
+    if attend_rate is None:
+        attend_rate = np.divide(present, total, out=np.ones_like(present), where=total > 0)
+    attend_rate = np.broadcast_to(np.clip(attend_rate, 0, 1), present.shape)
+    mc = _monte_carlo(present.ravel(), final_total.ravel(), remaining.ravel(), attend_rate.ravel(),
+                      trials, threshold, np.random.default_rng(seed))
+
+    result = {
+        'attend_all': attend_all,
+        'skip_k': skip_k,
+        'safe_skips': safe_skips,
+        'reachable': attend_all >= threshold,
+    }
+    for name, values in mc.items():
+        result[name] = values.reshape(present.shape)
+    return result
+
+
+def _monte_carlo(present, final_total, remaining, attend_rate, trials, threshold, rng):
+    """Random-absence simulation over flat arrays, processed in memory-bounded chunks"""
+    cells = present.shape[0]
+    out = {name: np.zeros(cells) for name in ('mc_mean', 'mc_p10', 'mc_p90', 'mc_prob_safe')}
+    if cells == 0 or trials <= 0:
+        return out
+
+    chunk = max(1, MONTE_CARLO_BUDGET // trials)
+    for start in range(0, cells, chunk):
+        part = slice(start, start + chunk)
+        attended = rng.binomial(remaining[part], attend_rate[part], size=(trials, len(remaining[part])))
+        denominator = final_total[part]
+        percentage = np.divide((present[part] + attended) * 100, denominator,
+                               out=np.zeros(attended.shape), where=denominator > 0)
+        out['mc_mean'][part] = percentage.mean(axis=0)
+        out['mc_p10'][part], out['mc_p90'][part] = np.percentile(percentage, [10, 90], axis=0)
+        out['mc_prob_safe'][part] = (percentage >= threshold).mean(axis=0)
+    return out
@@ -0,0 +1,156 @@
+import io
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import pdfplumber
+
+from attendance_calculator import parse_table_rows
+
+TEXT_FIELDS = ('course', 'date', 'start_time', 'end_time', 'attendance')
+# Unit separator, never present in extracted cell text
+FIELD_SEPARATOR = '\x1f'
+
+
+class BufferReader(io.RawIOBase):
+    """Seekable read-only file object over a memoryview, so pdfplumber can parse shared memory in place"""
+
+    def __init__(self, view):
+        self.view = view
+        self.position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self.position = offset
+        elif whence == io.SEEK_CUR:
+            self.position += offset
+        else:
+            self.position = len(self.view) + offset
+        return self.position
+
+    def readinto(self, buffer):
+        chunk = self.view[self.position:self.position + len(buffer)]
+        size = len(chunk)
+        buffer[:size] = chunk
+        self.position += size
+        return size
+
+    def close(self):
+        # Drop the view so the shared block can be closed afterwards
+        self.view.release()
+        super().close()
+
+
+def pack_records(records):
+    """Pack lecture records into an sr_no array and one delimited string, cheaper to pickle than dicts"""
+    sr_numbers = array('q', (record['sr_no'] for record in records))
+    text = FIELD_SEPARATOR.join(record[field] for record in records for field in TEXT_FIELDS)
+    return sr_numbers.tobytes(), text
+
+
+def unpack_records(packed):
+    """Inverse of pack_records"""
+    sr_bytes, text = packed
+    sr_numbers = array('q')
+    sr_numbers.frombytes(sr_bytes)
+    if not sr_numbers:
+        return []
+    values = text.split(FIELD_SEPARATOR)
+    width = len(TEXT_FIELDS)
+    return [
+        # Same key order as parse_table_rows, so DataFrame columns match the serial path
+        {'sr_no': sr_no, **dict(zip(TEXT_FIELDS, values[i * width:(i + 1) * width]))}
+        for i, sr_no in enumerate(sr_numbers)
+    ]
+
+
+def _extract_pages(name, size, page_numbers):
+    """Worker: parse the given pages straight from shared memory and return packed records"""
+    block = shared_memory.SharedMemory(name=name)
+    reader = BufferReader(block.buf[:size])
+    try:
+        with pdfplumber.open(reader) as pdf:
+            records = []
+            for page_number in page_numbers:
+                records.extend(parse_table_rows(pdf.pages[page_number].extract_tables()))
+        return pack_records(records)
+    finally:
+        # pdfplumber leaves streams it did not open to the caller
+        reader.close()
+        block.close()
+
+
+class SharedPDF:
+    def __init__(self, pdf_path):
+        """Read the PDF from disk once into a shared memory block"""
+        self.pdf_path = pdf_path
+        with open(pdf_path, 'rb') as f:
+            f.seek(0, io.SEEK_END)
+            self.size = f.tell()
+            f.seek(0)
+            self.block = shared_memory.SharedMemory(create=True, size=max(self.size, 1))
+            f.readinto(self.block.buf[:self.size])
+        self.readers = []
+
+    @property
+    def name(self):
+        return self.block.name
+
+    def open(self):
+        """Open pdfplumber on the shared bytes without copying them"""
+        reader = BufferReader(self.block.buf[:self.size])
+        self.readers.append(reader)
+        return pdfplumber.open(reader)
+
+    def extract_records(self, num_pages, workers, retries=2):
+        """Extract table rows from all pages using a pool of workers attached to the shared block.
+
+        Pages are split into one contiguous chunk per worker. A chunk that fails is
+        resubmitted up to `retries` times, reusing the same in-memory bytes.
+        """
+        chunk_size = -(-num_pages // workers) if num_pages else 1
+        chunks = [list(range(start, min(start + chunk_size, num_pages)))
+                  for start in range(0, num_pages, chunk_size)]
+        results = [None] * len(chunks)
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)) or 1) as executor:
+            pending = {executor.submit(_extract_pages, self.name, self.size, chunk): (i, 0)
+                       for i, chunk in enumerate(chunks)}
+            while pending:
+                future = next(iter(pending))
+                i, attempt = pending.pop(future)
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    if attempt >= retries:
+                        raise
+                    print(f"Retrying pages {chunks[i][0] + 1}-{chunks[i][-1] + 1}: {e}")
+                    pending[executor.submit(_extract_pages, self.name, self.size, chunks[i])] = (i, attempt + 1)
+
+        records = []
+        for packed in results:
+            records.extend(unpack_records(packed))
+        return records
+
+    def close(self):
+        """Free the shared block"""
+        for reader in self.readers:
+            reader.close()
+        self.readers = []
+        self.block.close()
+        self.block.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,50 @@
+import json
+
+from batch import BatchJournal, report_dir_name
+
+
+def entry(path, digest, status, attempt):
+    return {'path': path, 'sha256': digest, 'status': status, 'attempt': attempt, 'outputs': {}, 'error': None}
+
+
+def test_load_keeps_latest_entry_and_ignores_truncated_line(tmp_path):
+    journal_path = tmp_path / 'batch_journal.jsonl'
+    lines = [
+        json.dumps(entry('/in/a.pdf', 'aaa', 'failed', 1)),
+        json.dumps(entry('/in/a.pdf', 'aaa', 'done', 2)),
+        json.dumps(entry('/in/b.pdf', 'bbb', 'failed', 1)),
+    ]
+    # The last write was cut short by a crash
+    journal_path.write_text('\n'.join(lines) + '\n{"path": "/in/c.pdf", "sha', encoding='utf-8')
+
+    journal = BatchJournal(journal_path)
+    journal.load()
+    assert journal.status('/in/a.pdf', 'aaa')['status'] == 'done'
+    assert journal.status('/in/b.pdf', 'bbb')['attempt'] == 1
+    assert journal.status('/in/a.pdf', 'changed') is None
+    assert len(journal.entries) == 2
+
+
+def test_record_after_truncated_line_starts_a_new_line(tmp_path):
+    journal_path = tmp_path / 'batch_journal.jsonl'
+    journal_path.write_text('{"path": "/in/c.pdf", "sha', encoding='utf-8')
+
+    journal = BatchJournal(journal_path, fsync_every=1)
+    journal.open()
+    journal.record(entry('/in/c.pdf', 'ccc', 'done', 1))
+    journal.close()
+
+    reloaded = BatchJournal(journal_path)
+    reloaded.load()
+    assert reloaded.status('/in/c.pdf', 'ccc')['status'] == 'done'
+
+
+def test_load_without_journal(tmp_path):
+    journal = BatchJournal(tmp_path / 'missing.jsonl')
+    journal.load()
+    assert journal.entries == {}
+
+
+def test_report_dir_name_separates_same_named_inputs():
+    assert report_dir_name('/a/report.pdf', 'abcdef1234') == 'report-abcdef12'
+    assert report_dir_name('/a/report.pdf', 'abcdef1234') != report_dir_name('/b/report.pdf', '0123456789')
@@ -0,0 +1,52 @@
+from datetime import date
+
+from attendance_calculator import build_date_index, rollup_date_index, date_index_streaks
+
+# Jul 14, 2025 is a Monday
+MONDAY = date(2025, 7, 14).toordinal()
+
+
+def sample_index():
+    # Present Mon, absent Tue, two present on Thu, present the next Mon
+    return build_date_index({
+        MONDAY: [1, 0],
+        MONDAY + 1: [0, 1],
+        MONDAY + 3: [2, 0],
+        MONDAY + 7: [1, 0],
+    })
+
+
+def test_build_date_index_is_dense():
+    index = sample_index()
+    assert index['first_day'] == MONDAY
+    assert list(index['present']) == [1, 0, 0, 2, 0, 0, 0, 1]
+    assert list(index['absent']) == [0, 1, 0, 0, 0, 0, 0, 0]
+
+
+def test_build_date_index_caps_counts():
+    index = build_date_index({MONDAY: [300, 0]})
+    assert index['present'][0] == 255
+
+
+def test_rollup_by_week_keys_on_monday():
+    assert rollup_date_index(sample_index(), 'week') == {
+        date(2025, 7, 14): [3, 1],
+        date(2025, 7, 21): [1, 0],
+    }
+
+
+def test_rollup_by_month():
+    index = build_date_index({MONDAY: [1, 0], date(2025, 8, 4).toordinal(): [0, 2]})
+    assert rollup_date_index(index, 'month') == {
+        date(2025, 7, 1): [1, 0],
+        date(2025, 8, 1): [0, 2],
+    }
+
+
+def test_streaks_skip_days_without_lectures():
+    assert date_index_streaks(sample_index()) == {'longest': 2, 'current': 2, 'longest_absent': 1}
+
+
+def test_streaks_end_on_absence():
+    index = build_date_index({MONDAY: [1, 0], MONDAY + 1: [0, 1], MONDAY + 2: [1, 1]})
+    assert date_index_streaks(index) == {'longest': 1, 'current': 0, 'longest_absent': 2}
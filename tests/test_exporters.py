@@ -0,0 +1,48 @@
+from datetime import date
+
+import pytest
+
+from attendance_calculator import AttendanceCalculator
+from exporters import ExportPipeline, ExportSink, write_if_changed
+
+
+def calculator():
+    calc = AttendanceCalculator('test.pdf')
+    calc.attendance_data = [
+        {'sr_no': sr_no, 'course': 'Network SecurityT1 - BT Cyber B2', 'date': f"Jul {day:02d}, 2025",
+         'start_time': '09:00:00 AM', 'end_time': '10:00:00 AM', 'attendance': attendance}
+        for sr_no, (day, attendance) in enumerate([(14, 'P'), (15, 'A'), (16, 'P'), (17, 'P')], start=1)
+    ]
+    calc.calculate_subject_attendance()
+    calc.project_attendance(semester_end=date(2025, 8, 31))
+    return calc
+
+
+def test_write_if_changed_skips_identical_content(tmp_path):
+    path = tmp_path / 'report.txt'
+    digest, written = write_if_changed(path, 'same')
+    assert written
+    assert write_if_changed(path, 'same') == (digest, False)
+    assert write_if_changed(path, 'different')[1]
+    assert path.read_text(encoding='utf-8') == 'different'
+
+
+def test_rerun_with_projection_leaves_outputs_unchanged(tmp_path, capsys):
+    ExportPipeline().run(calculator(), tmp_path)
+    first = {path.name: path.stat().st_mtime_ns for path in tmp_path.iterdir()}
+    capsys.readouterr()
+
+    ExportPipeline().run(calculator(), tmp_path)
+    assert 'Wrote' not in capsys.readouterr().out
+    assert {path.name: path.stat().st_mtime_ns for path in tmp_path.iterdir()} == first
+
+
+def test_export_sink_requires_render():
+    with pytest.raises(TypeError):
+        ExportSink()
+
+    class IncompleteSink(ExportSink):
+        name = 'incomplete'
+
+    with pytest.raises(TypeError):
+        IncompleteSink()
@@ -0,0 +1,49 @@
+from datetime import date, timedelta
+
+import numpy as np
+
+import projection
+from attendance_calculator import build_date_index
+
+
+def test_scenarios_for_one_student():
+    result = projection.project_attendance([8, 5], [10, 10], [10, 0], max_skip=3, trials=200)
+    np.testing.assert_allclose(result['attend_all'], [90, 50])
+    assert result['skip_k'].shape == (4, 2)
+    np.testing.assert_allclose(result['skip_k'][:, 0], [90, 85, 80, 75])
+    # Nothing left to skip, the score stays where it is
+    np.testing.assert_allclose(result['skip_k'][:, 1], [50, 50, 50, 50])
+    assert result['safe_skips'].tolist() == [2, 0]
+    assert result['reachable'].tolist() == [True, False]
+
+
+def test_cohort_shapes():
+    present = np.full((3, 2), 8)
+    result = projection.project_attendance(present, np.full((3, 2), 10), np.full((3, 2), 5), max_skip=4, trials=50)
+    assert result['attend_all'].shape == (3, 2)
+    assert result['skip_k'].shape == (5, 3, 2)
+    for name in ('mc_mean', 'mc_p10', 'mc_p90', 'mc_prob_safe'):
+        assert result[name].shape == (3, 2)
+
+
+def test_monte_carlo_is_deterministic_without_a_seed():
+    args = ([8, 5, 12], [10, 10, 15], [10, 4, 6])
+    first = projection.project_attendance(*args, trials=500)
+    second = projection.project_attendance(*args, trials=500)
+    for name in ('mc_mean', 'mc_p10', 'mc_p90', 'mc_prob_safe'):
+        np.testing.assert_array_equal(first[name], second[name])
+
+
+def test_monte_carlo_with_certain_attendance_matches_attend_all():
+    result = projection.project_attendance([8, 5], [10, 10], [10, 0], trials=100, attend_rate=1.0)
+    np.testing.assert_allclose(result['mc_mean'], result['attend_all'])
+    assert result['mc_prob_safe'].tolist() == [1.0, 0.0]
+
+
+def test_extrapolate_remaining_from_past_frequency():
+    first = date(2025, 7, 14)
+    # One lecture a day for two weeks, a week left in the semester
+    index = build_date_index({(first + timedelta(days=i)).toordinal(): [1, 0] for i in range(14)})
+    assert projection.extrapolate_remaining(index, first + timedelta(days=20)) == 7
+    assert projection.extrapolate_remaining(index, first) == 0
+    assert projection.extrapolate_remaining(None, first) == 0
@@ -0,0 +1,30 @@
+import io
+
+from shared_pdf import BufferReader, pack_records, unpack_records
+
+
+def test_pack_round_trip_keeps_records_and_key_order():
+    records = [
+        {'sr_no': 1, 'course': 'Visual AnalyticsP1 - BT Cyber B2', 'date': 'Jul 14, 2025',
+         'start_time': '2:00:01 PM', 'end_time': '3:00:00 PM', 'attendance': 'A'},
+        {'sr_no': 2, 'course': 'Network SecurityT1', 'date': 'Jul 15, 2025',
+         'start_time': '9:00:00 AM', 'end_time': '10:00:00 AM', 'attendance': 'P'},
+    ]
+    unpacked = unpack_records(pack_records(records))
+    assert unpacked == records
+    assert [list(record) for record in unpacked] == [list(record) for record in records]
+
+
+def test_pack_round_trip_empty():
+    assert unpack_records(pack_records([])) == []
+
+
+def test_buffer_reader_reads_and_seeks():
+    reader = BufferReader(memoryview(b'%PDF-1.7 body %%EOF'))
+    assert reader.read(4) == b'%PDF'
+    reader.seek(-5, io.SEEK_END)
+    assert reader.read() == b'%%EOF'
+    reader.seek(1)
+    reader.seek(2, io.SEEK_CUR)
+    assert reader.tell() == 3
+    reader.close()
@@ -0,0 +1,60 @@
+from attendance_calculator import AttendanceCalculator, longest_increasing_positions
+
+
+def lecture(sr_no, day, start, end, attendance='P', course='Network SecurityT1 - BT Cyber B2'):
+    return {'sr_no': sr_no, 'course': course, 'date': f"Jul {day:02d}, 2025",
+            'start_time': start, 'end_time': end, 'attendance': attendance}
+
+
+def calculator(records):
+    calc = AttendanceCalculator('test.pdf')
+    calc.attendance_data = records
+    return calc
+
+
+def test_longest_increasing_positions():
+    # The stray 99 is the only value outside the longest increasing run
+    assert longest_increasing_positions([1, 2, 99, 5, 6]) == {0, 1, 3, 4}
+    assert longest_increasing_positions([]) == set()
+    assert longest_increasing_positions([3, 2, 1]) in ({0}, {1}, {2})
+
+
+def test_out_of_order_flags_only_the_stray_record():
+    records = [lecture(sr, day, '09:00:00 AM', '10:00:00 AM') for sr, day in zip([1, 2, 99, 5, 6], range(14, 19))]
+    findings = calculator(records).validate_records()
+    assert findings['Network Security']['out_of_order'] == [99]
+
+
+def test_duplicates_and_overlaps():
+    records = [
+        lecture(1, 14, '09:00:00 AM', '10:00:00 AM'),
+        lecture(2, 14, '09:00:00 AM', '10:00:00 AM'),
+        lecture(3, 14, '09:30:00 AM', '11:00:00 AM', course='Visual AnalyticsP1 - BT Cyber B2'),
+        lecture(4, 14, '11:00:00 AM', '12:00:00 PM'),
+    ]
+    findings = calculator(records).validate_records()
+    assert findings['Network Security']['duplicates'] == [2]
+    assert findings['Network Security']['overlaps'] == []
+    assert findings['Visual Analytics']['overlaps'] == [(3, 1)]
+    assert findings['Visual Analytics']['out_of_order'] == []
+
+
+def test_overlap_is_checked_against_the_latest_ending_lecture():
+    records = [
+        lecture(1, 14, '09:00:00 AM', '12:00:00 PM'),
+        lecture(2, 14, '10:00:00 AM', '10:30:00 AM'),
+        lecture(3, 14, '11:00:00 AM', '11:30:00 AM'),
+    ]
+    findings = calculator(records).validate_records()
+    assert findings['Network Security']['overlaps'] == [(2, 1), (3, 1)]
+
+
+def test_deduplicate_drops_exact_duplicates():
+    records = [
+        lecture(1, 14, '09:00:00 AM', '10:00:00 AM'),
+        lecture(2, 14, '09:00:00 AM', '10:00:00 AM'),
+        lecture(3, 14, '09:00:00 AM', '10:00:00 AM', attendance='A'),
+    ]
+    calc = calculator(records)
+    calc.validate_records(deduplicate=True)
+    assert [record['sr_no'] for record in calc.attendance_data] == [1, 3]
@@ -0,0 +1,201 @@
+import argparse
+import hashlib
+import json
+import os
+import signal
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait
+from pathlib import Path
+
+from attendance_calculator import process_pdf
+
+STATE_FILE = '.watch_state.json'
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """Hash a file's contents in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _ignore_interrupts():
+    """Leave Ctrl+C to the main process so workers finish their current file"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def publish_pdf(pdf_path, report_dir, deduplicate=False):
+    """Process one PDF into its report folder.
+
+    The export pipeline writes each report atomically, so readers never see a
+    half-written file.
+    """
+    return process_pdf(pdf_path, report_dir, deduplicate=deduplicate)
+
+
+class FolderWatcher:
+    def __init__(self, watch_dir, output_dir, interval=2.0, settle=5.0, workers=2, max_in_flight=None,
+                 deduplicate=False, retries=3):
+        self.watch_dir = Path(watch_dir)
+        self.output_dir = Path(output_dir)
+        self.interval = interval
+        self.settle = settle
+        self.workers = workers
+        self.max_in_flight = max_in_flight or workers * 2
+        self.deduplicate = deduplicate
+        self.retries = retries
+        self.state_path = self.output_dir / STATE_FILE
+        # path -> {'sha256', 'size', 'mtime_ns', 'status', 'attempts'} of the last processed version
+        self.processed = {}
+        # path -> ((size, mtime_ns), time the signature was first seen)
+        self.candidates = {}
+        self.queue = deque()
+        self.queued = set()
+        self.in_flight = {}
+
+    def load_state(self):
+        """Load the record of already processed files so restarts skip them"""
+        if self.state_path.exists():
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                self.processed = json.load(f)
+
+    def save_state(self):
+        """Write the processed-file record atomically"""
+        tmp_path = self.state_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.processed, f, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def needs_retry(self, entry):
+        """A failed version is retried until it has used up its attempts"""
+        return entry.get('status', 'done') == 'failed' and entry.get('attempts', 0) < self.retries
+
+    def scan(self):
+        """Queue PDFs that are new or changed and have stopped growing"""
+        now = time.monotonic()
+        seen = set()
+        for path in self.watch_dir.glob('*.pdf'):
+            # Resolved, so the state matches however the folder was passed on the command line
+            key = str(path.resolve())
+            seen.add(key)
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            signature = (stat.st_size, stat.st_mtime_ns)
+
+            done = self.processed.get(key)
+            if done and (done['size'], done['mtime_ns']) == signature and not self.needs_retry(done):
+                continue
+
+            # Debounce: wait until size and mtime hold still for `settle` seconds
+            previous = self.candidates.get(key)
+            if not previous or previous[0] != signature:
+                self.candidates[key] = (signature, now)
+                continue
+            if now - previous[1] < self.settle or key in self.queued:
+                continue
+
+            # A touched but identical file only needs its signature refreshed
+            digest = file_sha256(path)
+            same_content = done and done['sha256'] == digest
+            if same_content and not self.needs_retry(done):
+                self.processed[key] = dict(done, size=signature[0], mtime_ns=signature[1])
+                del self.candidates[key]
+                continue
+
+            # Failed attempts only count against the same content
+            attempts = done.get('attempts', 0) if same_content else 0
+            self.queue.append((key, digest, signature, attempts))
+            self.queued.add(key)
+
+        # Forget candidates that disappeared before settling
+        for key in list(self.candidates):
+            if key not in seen:
+                del self.candidates[key]
+
+    def submit(self, executor):
+        """Hand queued files to the pool without exceeding the in-flight limit"""
+        while self.queue and len(self.in_flight) < self.max_in_flight:
+            item = self.queue.popleft()
+            # One folder per watched file, replaced in place when the file changes
+            report_dir = self.output_dir / Path(item[0]).stem
+            future = executor.submit(publish_pdf, item[0], str(report_dir), self.deduplicate)
+            self.in_flight[future] = item
+
+    def collect(self):
+        """Record finished jobs; returns True if the state changed"""
+        changed = False
+        for future in [f for f in self.in_flight if f.done()]:
+            key, digest, signature, attempts = self.in_flight.pop(future)
+            self.queued.discard(key)
+            self.candidates.pop(key, None)
+            try:
+                outputs = future.result()
+                error = None if outputs else "could not extract data"
+            except Exception as e:
+                outputs, error = None, str(e)
+
+            attempts += 1
+            self.processed[key] = {
+                'sha256': digest,
+                'size': signature[0],
+                'mtime_ns': signature[1],
+                'status': 'failed' if error else 'done',
+                'attempts': attempts
+            }
+            changed = True
+            if not error:
+                print(f"Published {Path(key).name} -> {Path(outputs['manifest']).parent}")
+            elif attempts < self.retries:
+                print(f"Failed to process {key} ({error}), will retry")
+            else:
+                print(f"Failed to process {key} after {attempts} attempt(s): {error}; skipping until it changes")
+        return changed
+
+    def run(self):
+        """Poll the folder until interrupted"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.load_state()
+        print(f"Watching {self.watch_dir} (every {self.interval}s, {self.workers} worker(s)). Press Ctrl+C to stop.")
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_ignore_interrupts) as executor:
+            try:
+                while True:
+                    self.scan()
+                    self.submit(executor)
+                    if self.collect():
+                        self.save_state()
+                    time.sleep(self.interval)
+            except KeyboardInterrupt:
+                print("\nStopping, waiting for running jobs...")
+                wait(list(self.in_flight))
+                if self.collect():
+                    self.save_state()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Watch a folder and process attendance PDFs as they arrive")
+    parser.add_argument('watch_dir', help="Folder that receives downloaded attendance PDFs")
+    parser.add_argument('--output', default='reports', help="Folder for published reports (default: reports)")
+    parser.add_argument('--interval', type=float, default=2.0, help="Seconds between folder scans")
+    parser.add_argument('--settle', type=float, default=5.0, help="Seconds a file must stay unchanged before processing")
+    parser.add_argument('--workers', type=int, default=2, help="Number of worker processes")
+    parser.add_argument('--dedupe', action='store_true', help="Drop exact duplicate lecture records before calculating")
+    parser.add_argument('--retries', type=int, default=3, help="Attempts per file version before giving up")
+    args = parser.parse_args()
+
+    if not Path(args.watch_dir).is_dir():
+        print(f"Error: Folder not found: {args.watch_dir}")
+        sys.exit(1)
+
+    FolderWatcher(args.watch_dir, args.output, interval=args.interval, settle=args.settle,
+                  workers=args.workers, deduplicate=args.dedupe, retries=args.retries).run()
+
+
+if __name__ == "__main__":
+    main()